@@ -9,6 +9,7 @@ from abc import ABCMeta, abstractmethod
 
 import networkx as nx
 import scipy
+from joblib import Parallel, delayed
 
 import geomstats.backend as gs
 from geomstats.errors import check_parameter_accepted_values
@@ -20,6 +21,30 @@ from geomstats.geometry.stratified.point_set import (
     _vectorize_point,
 )
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+_USE_NUMBA = numba is not None and gs.__name__.endswith("numpy")
+_NUMBA_MIN_BATCH_SIZE = 32
+
+if _USE_NUMBA:
+
+    @numba.njit(parallel=True, cache=True)
+    def _permute_batch_numba(graphs, permutations, out):
+        """Permute the nodes of a batch of graphs in nopython mode."""
+        n_graphs = graphs.shape[0]
+        n_perms = permutations.shape[0]
+        n_nodes = graphs.shape[1]
+        for batch in numba.prange(out.shape[0]):
+            i_graph = batch % n_graphs
+            i_perm = batch % n_perms
+            for i in range(n_nodes):
+                perm_i = permutations[i_perm, i]
+                for j in range(n_nodes):
+                    out[batch, i, j] = graphs[i_graph, perm_i, permutations[i_perm, j]]
+
 
 def _pad_graph_points_with_zeros(points, n_nodes, copy=False):
     """Pad graphs point with zeros.
@@ -40,7 +65,7 @@ def _pad_graph_points_with_zeros(points, n_nodes, copy=False):
     points : GraphPoint
         Set of Graphs with the new number of nodes.
     """
-    if type(points) is GraphPoint:
+    if isinstance(points, GraphPoint):
         if copy:
             points = GraphPoint(points.adj)
 
@@ -101,7 +126,7 @@ def _pad_points_with_zeros(points, n_nodes, copy=True):
     array : array-like, shape=[..., n_nodes, n_nodes] or GraphPoint
         Set of adjacency matrices or GraphPoint with the new number of nodes.
     """
-    if type(points) in [list, tuple, GraphPoint]:
+    if isinstance(points, _GRAPH_TYPES):
         points = _pad_graph_points_with_zeros(points, n_nodes, copy=copy)
     else:
         points = _pad_array_with_zeros(points, n_nodes)
@@ -109,6 +134,66 @@ def _pad_points_with_zeros(points, n_nodes, copy=True):
     return points
 
 
+def _permute_single(graph, permutation):
+    """Permute the nodes of a single graph.
+
+    Parameters
+    ----------
+    graph : array-like, shape=[n_nodes, n_nodes]
+        Adjacency matrix.
+    permutation : array-like, shape=[n_nodes]
+        Node permutation.
+
+    Returns
+    -------
+    permuted_graph : array-like, shape=[n_nodes, n_nodes]
+        Permuted adjacency matrix.
+    """
+    return graph[permutation][:, permutation]
+
+
+def _permute_batch(graphs, permutations):
+    """Permute the nodes of a batch of graphs.
+
+    Parameters
+    ----------
+    graphs : array-like, shape=[n_graphs, n_nodes, n_nodes]
+        Adjacency matrices.
+    permutations : array-like, shape=[n_perms, n_nodes]
+        Node permutations. n_graphs and n_perms must be broadcastable.
+
+    Returns
+    -------
+    permuted_graphs : array-like, shape=[max(n_graphs, n_perms), n_nodes, n_nodes]
+        Permuted adjacency matrices.
+
+    Notes
+    -----
+    With the numpy backend, batches of at least 32 graphs are permuted by a
+    parallel numba kernel if numba is installed.
+    """
+    n_graphs, n_perms = graphs.shape[0], permutations.shape[0]
+    if n_graphs != n_perms and 1 not in (n_graphs, n_perms):
+        raise ValueError(
+            f"Cannot broadcast {n_graphs} graphs with {n_perms} permutations."
+        )
+
+    n_nodes = graphs.shape[-1]
+    if gs.amin(permutations) < 0 or gs.amax(permutations) >= n_nodes:
+        raise IndexError(
+            f"Permutation indices must be in [0, {n_nodes}) for {n_nodes} nodes."
+        )
+
+    n_batch = max(n_graphs, n_perms)
+    if _USE_NUMBA and n_batch >= _NUMBA_MIN_BATCH_SIZE:
+        out = gs.empty((n_batch,) + graphs.shape[1:], dtype=graphs.dtype)
+        _permute_batch_numba(graphs, permutations, out)
+        return out
+
+    batch_indices = gs.reshape(gs.arange(graphs.shape[0]), (-1, 1, 1))
+    return graphs[batch_indices, permutations[:, :, None], permutations[:, None, :]]
+
+
 def _vectorize_graph(*args_positions):
     """Vectorize GraphPoint or array into array.
 
@@ -128,13 +213,13 @@ def _vectorize_graph(*args_positions):
     """
 
     def _manipulate_input(arg):
-        if type(arg) not in [list, tuple, GraphPoint]:
+        if not isinstance(arg, _GRAPH_TYPES):
             return arg
 
-        if type(arg) is GraphPoint:
+        if isinstance(arg, GraphPoint):
             return arg.adj
 
-        return gs.array([graph.adj for graph in arg])
+        return gs.stack([graph.adj for graph in arg])
 
     return _vectorize_point(*args_positions, manipulate_input=_manipulate_input)
 
@@ -157,10 +242,10 @@ def _vectorize_graph_to_points(*args_positions):
     """
 
     def _manipulate_input(arg):
-        if type(arg) in [list, tuple]:
+        if isinstance(arg, _GRAPH_SET_TYPES):
             return arg
 
-        if type(arg) is GraphPoint:
+        if isinstance(arg, GraphPoint):
             return [arg]
 
         if arg.ndim == 2:
@@ -203,7 +288,9 @@ class _BaseAligner(metaclass=ABCMeta):
     ----------
     perm_ : array-like, shape=[..., n_nodes]
         Node permutations where in position i we have the value j meaning
-        the node i should be permuted with node j.
+        the node i should be permuted with node j. It may be a read-only
+        view (e.g. the broadcast identity of IDAligner): copy it before
+        modifying it in place.
     """
 
     def __init__(self):
@@ -245,6 +332,14 @@ class _BaseAligner(metaclass=ABCMeta):
 class FAQAligner(_BaseAligner):
     """Fast Quadratic Assignment for graph matching (or network alignment).
 
+    Parameters
+    ----------
+    n_jobs : int or None
+        Number of jobs for solving the assignment problems of a batch of graphs
+        in parallel (thread-based). Follows joblib semantics: None means 1
+        unless in a joblib backend context, -1 means using all processors.
+        Optional, default: 1.
+
     References
     ----------
     .. [Vogelstein2015] Vogelstein JT, Conroy JM, Lyzinski V, Podrazik LJ,
@@ -253,6 +348,10 @@ class FAQAligner(_BaseAligner):
         PLoS One. 2015 Apr 17; doi: 10.1371/journal.pone.0121002.
     """
 
+    def __init__(self, n_jobs=1):
+        super().__init__()
+        self.n_jobs = n_jobs
+
     def align(self, metric, base_graph, graph_to_permute):
         """Align graphs.
 
@@ -270,14 +369,25 @@ class FAQAligner(_BaseAligner):
         permuted_graph : array-like, shape=[..., n_nodes, n_nodes]
             Permuted graph as to be aligned with respect to the geodesic.
         """
-        base_graph, graph_to_permute, is_single = self._broadcast(
-            base_graph, graph_to_permute
-        )
-
-        perm = [
-            gs.linalg.quadratic_assignment(x, y, options={"maximize": True})
-            for x, y in zip(base_graph, graph_to_permute)
-        ]
+        if gs.ndim(base_graph) == 2 and gs.ndim(graph_to_permute) == 3:
+            is_single = False
+            base_graphs = itertools.repeat(base_graph)
+        else:
+            base_graph, graph_to_permute, is_single = self._broadcast(
+                base_graph, graph_to_permute
+            )
+            base_graphs = base_graph
+
+        n_jobs = self.n_jobs
+        if n_jobs is not None:
+            n_jobs = min(n_jobs, len(graph_to_permute))
+        with Parallel(n_jobs=n_jobs, prefer="threads", verbose=0) as parallel:
+            perm = parallel(
+                delayed(gs.linalg.quadratic_assignment)(
+                    x, y, options={"maximize": True}
+                )
+                for x, y in zip(base_graphs, graph_to_permute)
+            )
 
         self.perm_ = gs.array(perm[0]) if is_single else gs.array(perm)
 
@@ -292,6 +402,14 @@ class IDAligner(_BaseAligner):
     graphs.
     """
 
+    def __init__(self):
+        super().__init__()
+        self._id_perm = None
+
+    def _set_id_perm(self, n_nodes):
+        if self._id_perm is None or self._id_perm.shape[0] != n_nodes:
+            self._id_perm = gs.arange(n_nodes)
+
     def align(self, metric, base_graph, graph_to_permute):
         """Align graphs.
 
@@ -313,10 +431,10 @@ class IDAligner(_BaseAligner):
             base_graph, graph_to_permute
         )
 
-        n_nodes = base_graph.shape[1]
-        perm = gs.reshape(gs.tile(range(n_nodes), base_graph.shape[0]), (-1, n_nodes))
+        self._set_id_perm(base_graph.shape[1])
+        perm = gs.broadcast_to(self._id_perm, base_graph.shape[:2])
 
-        self.perm_ = gs.array(perm[0]) if is_single else gs.array(perm)
+        self.perm_ = perm[0] if is_single else perm
 
         return self._permute(metric, graph_to_permute, self.perm_)
 
@@ -425,10 +543,13 @@ class PointToGeodesicAligner(_BasePointToGeodesicAligner):
         Metric between elements of GraphSpace.
     s_min : float
         Minimum value of the domain to sample along the geodesics.
+        Optional, default: -1.
     s_max : float
         Minimum value of the domain to sample along the geodesics.
+        Optional, default: 1.
     n_points: int
         Number of points to sample between s_min and s_max.
+        Optional, default: 10.
 
     References
     ----------
@@ -441,7 +562,7 @@ class PointToGeodesicAligner(_BasePointToGeodesicAligner):
         isometric Lie group actions." Statistica Sinica, 1-58, 2010.
     """
 
-    def __init__(self, s_min, s_max, n_points=10):
+    def __init__(self, s_min=-1.0, s_max=1.0, n_points=10):
         super().__init__()
         self.s_min = s_min
         self.s_max = s_max
@@ -619,6 +740,13 @@ class GraphPoint(Point):
         super().__init__()
         self.adj = adj
 
+    def __setattr__(self, attr_name, value):
+        """Set attributes."""
+        if attr_name == "adj":
+            object.__setattr__(self, "_hash", None)
+
+        return object.__setattr__(self, attr_name, value)
+
     @property
     def n_nodes(self):
         """Retrieve the number of nodes."""
@@ -629,8 +757,17 @@ class GraphPoint(Point):
         return f"Adjacency: {self.adj}"
 
     def __hash__(self):
-        """Return the hash of the instance."""
-        return hash(self.adj)
+        """Return the hash of the instance.
+
+        The hash is computed from the bytes of the adjacency matrix and cached
+        until `adj` is reassigned. In-place modifications of `adj` are not
+        tracked.
+        """
+        if self._hash is None:
+            adj = gs.to_numpy(self.adj)
+            self._hash = hash((adj.shape, adj.tobytes()))
+
+        return self._hash
 
     def to_array(self):
         """Return a copy of the adjacency matrix."""
@@ -641,6 +778,10 @@ class GraphPoint(Point):
         return nx.from_numpy_array(self.adj)
 
 
+_GRAPH_SET_TYPES = (list, tuple)
+_GRAPH_TYPES = _GRAPH_SET_TYPES + (GraphPoint,)
+
+
 class GraphSpace(PointSet):
     r"""Class for the Graph Space.
 
@@ -680,7 +821,6 @@ class GraphSpace(PointSet):
             Matrices(n_nodes, n_nodes) if total_space is None else total_space
         )
 
-    @_pad_with_zeros((1, "graphs"))
     def belongs(self, graphs, atol=gs.atol):
         """Check if the point belongs to the space.
 
@@ -696,12 +836,19 @@ class GraphSpace(PointSet):
         -------
         belongs : array-like, shape=[..., n_nodes]
             Boolean denoting if graph belongs to the space.
+
+        Notes
+        -----
+        Graphs with fewer nodes belong to the space, as they can be padded with
+        zeros. Array inputs are checked against the total space without going
+        through the graph vectorization decorators.
         """
-        if type(graphs) in [list, tuple]:
-            return gs.array([graph.n_nodes == self.n_nodes for graph in graphs])
-        elif type(graphs) is GraphPoint:
-            return graphs.n_nodes == self.n_nodes
+        if isinstance(graphs, _GRAPH_SET_TYPES):
+            return gs.array([graph.n_nodes <= self.n_nodes for graph in graphs])
+        elif isinstance(graphs, GraphPoint):
+            return graphs.n_nodes <= self.n_nodes
 
+        graphs = _pad_array_with_zeros(graphs, self.n_nodes)
         return self.total_space.belongs(graphs, atol=atol)
 
     def random_point(self, n_samples=1, bound=1.0):
@@ -739,8 +886,8 @@ class GraphSpace(PointSet):
         """
         return gs.copy(points)
 
-    @_vectorize_graph_to_points((1, "points"))
     @_pad_with_zeros((1, "points"))
+    @_vectorize_graph((1, "points"))
     def set_to_networkx(self, points):
         """Turn points into a networkx object.
 
@@ -753,7 +900,10 @@ class GraphSpace(PointSet):
         nx_list : list of networkx object
             An array containing all the Graphs.
         """
-        networkx_objs = [pt.to_networkx() for pt in points]
+        if points.ndim == 2:
+            return nx.from_numpy_array(points)
+
+        networkx_objs = list(map(nx.from_numpy_array, points))
         return networkx_objs if len(networkx_objs) > 1 else networkx_objs[0]
 
     @_vectorize_graph((1, "graph_to_permute"))
@@ -774,27 +924,25 @@ class GraphSpace(PointSet):
         -------
         graphs_permuted : array-like, shape=[..., n_nodes, n_nodes]
             Graphs permuted.
-        """
 
-        def _get_permutation_matrix(indices_):
-            return gs.array_from_sparse(
-                data=gs.ones(self.n_nodes, dtype=gs.int64),
-                indices=list(zip(range(self.n_nodes), indices_)),
-                target_shape=(self.n_nodes, self.n_nodes),
-            )
+        Notes
+        -----
+        The action :math:`P A P^T` of a permutation matrix is computed as the
+        gather :math:`A[p][:, p]`, avoiding the construction of permutation
+        matrices and the matrix products.
+        """
+        is_single_graph = gs.ndim(graph_to_permute) == 2
+        is_single_perm = gs.ndim(permutation) == 1
+        if is_single_graph and is_single_perm:
+            return _permute_single(graph_to_permute, permutation)
 
-        if gs.ndim(permutation) == 1:
-            perm_matrices = _get_permutation_matrix(permutation)
-        else:
-            perm_matrices = []
-            for indices_ in permutation:
-                perm_matrices.append(_get_permutation_matrix(indices_))
-            perm_matrices = gs.stack(perm_matrices)
+        if is_single_graph:
+            graph_to_permute = gs.expand_dims(graph_to_permute, 0)
+        if is_single_perm:
+            permutation = gs.expand_dims(permutation, 0)
 
-        permuted_graph = Matrices.mul(
-            perm_matrices, graph_to_permute, Matrices.transpose(perm_matrices)
-        )
-        if gs.ndim(permuted_graph) == 3 and gs.shape(permuted_graph)[0] == 1:
+        permuted_graph = _permute_batch(graph_to_permute, permutation)
+        if gs.shape(permuted_graph)[0] == 1:
             return permuted_graph[0]
 
         return permuted_graph
@@ -840,8 +988,13 @@ class GraphSpaceMetric(PointSetMetric):
         "exhaustive": ExhaustiveAligner,
     }
 
+    MAP_POINT_TO_GEODESIC_ALIGNER = {
+        "default": PointToGeodesicAligner,
+    }
+
     def __init__(self, space):
         super().__init__(space)
+        self.n_nodes = space.n_nodes
         self.aligner = self._set_default_aligner()
         self.point_to_geodesic_aligner = None
 
@@ -897,6 +1050,8 @@ class GraphSpaceMetric(PointSetMetric):
 
         Parameters
         ----------
+        aligner : str or _BasePointToGeodesicAligner
+            'default' PointToGeodesicAligner
         s_min : float
             Minimum value of the domain to sample along the geodesics.
         s_max : float
@@ -915,11 +1070,14 @@ class GraphSpaceMetric(PointSetMetric):
             "Intrinsic shape analysis: Geodesic PCA for Riemannian manifolds modulo
             isometric Lie group actions." Statistica Sinica, 1-58, 2010.
         """
-        if aligner == "default":
-            kwargs.setdefault("s_min", -1.0)
-            kwargs.setdefault("s_max", 1.0)
-            kwargs.setdefault("n_points", 10)
-            aligner = PointToGeodesicAligner(**kwargs)
+        if isinstance(aligner, str):
+            check_parameter_accepted_values(
+                aligner,
+                "aligner",
+                list(self.MAP_POINT_TO_GEODESIC_ALIGNER.keys()),
+            )
+
+            aligner = self.MAP_POINT_TO_GEODESIC_ALIGNER.get(aligner)(**kwargs)
 
         self.point_to_geodesic_aligner = aligner
         return self.point_to_geodesic_aligner
@@ -934,11 +1092,6 @@ class GraphSpaceMetric(PointSetMetric):
         """Set the total space metric."""
         self.space.total_space.metric = value
 
-    @property
-    def n_nodes(self):
-        """Retrieve the number of nodes."""
-        return self.space.n_nodes
-
     @_vectorize_graph((1, "graph_a"), (2, "graph_b"))
     @_pad_with_zeros((1, "graph_a"), (2, "graph_b"))
     def dist(self, graph_a, graph_b):
@@ -29,7 +29,7 @@ def broadcast_lists(list_a, list_b):
 
 
 def _manipulate_input(arg):
-    if not (type(arg) in [list, tuple]):
+    if not isinstance(arg, (list, tuple)):
         return [arg]
 
     return arg
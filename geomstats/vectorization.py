@@ -3,6 +3,8 @@
 This abstracts the backend type.
 """
 
+import inspect
+
 import geomstats.backend as gs
 
 POINT_TYPES = ["scalar", "vector", "matrix"]
@@ -87,21 +89,23 @@ def decorator(input_types):
         input_types = list(input_types)
 
     def aux_decorator(function):
+        param_names = list(inspect.signature(function).parameters)
+
         def wrapper(*args, **kwargs):
             args_types, kwargs_types, opt_kwargs_types, is_scal = get_types(
-                input_types, args, kwargs
+                input_types, args, kwargs, param_names=param_names
             )
             args_types, kwargs_types, kwargs = adapt_types(
                 args_types, kwargs_types, opt_kwargs_types, args, kwargs
             )
             args_kwargs_types = args_types + kwargs_types
 
-            args_shapes = get_initial_shapes(args_types, args)
-            kwargs_shapes = get_initial_shapes(kwargs_types, kwargs.values())
+            args_shapes, vect_args = shape_and_vectorize(args_types, args)
+            kwargs_shapes, vect_kwargs_values = shape_and_vectorize(
+                kwargs_types, kwargs.values()
+            )
             initial_shapes = args_shapes + kwargs_shapes
-
-            vect_args = vectorize_args(args_types, args)
-            vect_kwargs = vectorize_kwargs(kwargs_types, kwargs)
+            vect_kwargs = dict(zip(kwargs.keys(), vect_kwargs_values))
 
             result = function(*vect_args, **vect_kwargs)
 
@@ -114,7 +118,7 @@ def decorator(input_types):
     return aux_decorator
 
 
-def get_types(input_types, args, kwargs):
+def get_types(input_types, args, kwargs, param_names=None):
     """Extract the types of args, kwargs, optional kwargs and output.
 
     Parameters
@@ -125,6 +129,11 @@ def get_types(input_types, args, kwargs):
         Args of a function.
     kwargs : dict
         Kwargs of a function.
+    param_names : list
+        Names of the parameters of the function, in the order of its signature.
+        If given, the types of kwargs and optional kwargs are matched by name,
+        otherwise kwargs are assumed to follow the order of the signature.
+        Optional, default: None.
 
     Returns
     -------
@@ -153,6 +162,15 @@ def get_types(input_types, args, kwargs):
             if last_input_type != "output_scalar":
                 is_scal = False
                 opt_kwargs_types = input_types[len_total:-1]
+
+    if param_names is not None:
+        params_types = dict(zip(param_names, input_types))
+        kwargs_types = [params_types.get(key, "else") for key in kwargs]
+        opt_kwargs_types = [
+            params_types[name]
+            for name in param_names[len_args:]
+            if name not in kwargs and name in params_types
+        ]
     return (args_types, kwargs_types, opt_kwargs_types, is_scal)
 
 
@@ -228,19 +246,103 @@ def get_initial_shapes(input_types, args):
     in_shapes : list
         Shapes of array-like input args, or kwargs values.
     """
-    in_shapes = []
+    return [_arg_shape(arg, input_type) for arg, input_type in zip(args, input_types)]
 
-    for arg, input_type in zip(args, input_types):
-        if input_type == "scalar":
-            arg = gs.array(arg)
 
-        if input_type in POINT_TYPES and arg is not None:
-            in_shapes.append(gs.shape(arg))
-        elif input_type in OTHER_TYPES or arg is None:
-            in_shapes.append(None)
-        else:
-            raise ValueError(ERROR_MSG % input_type)
-    return in_shapes
+def _arg_shape(arg, input_type):
+    """Extract the shape of a single input arg.
+
+    Parameters
+    ----------
+    arg : unspecified
+        Arg, or kwarg value, of a function.
+    input_type : str
+        Point type corresponding to the arg.
+
+    Returns
+    -------
+    in_shape : tuple or None
+        Shape of the arg if array-like, None otherwise.
+    """
+    is_scalar_type = input_type == "scalar"
+    if is_scalar_type or (input_type in POINT_TYPES_TO_NDIMS and arg is not None):
+        return gs.shape(arg)
+    if input_type in OTHER_TYPES or arg is None:
+        return None
+    raise ValueError(ERROR_MSG % input_type)
+
+
+def _vectorize_arg(arg, input_type):
+    """Vectorize a single input arg.
+
+    Parameters
+    ----------
+    arg : unspecified
+        Arg, or kwarg value, of a function.
+    input_type : str
+        Point type corresponding to the arg.
+
+    Returns
+    -------
+    vect_arg : unspecified
+        Arg in its fully-vectorized form.
+    """
+    to_ndim = POINT_TYPES_TO_NDIMS.get(input_type)
+    if input_type == "scalar":
+        vect_arg = gs.to_ndarray(arg, to_ndim=1)
+        if gs.ndim(vect_arg) == 1:
+            vect_arg = gs.expand_dims(vect_arg, axis=1)
+        return vect_arg
+    if to_ndim is not None and arg is not None:
+        return gs.to_ndarray(arg, to_ndim=to_ndim)
+    if input_type in OTHER_TYPES or arg is None:
+        return arg
+    raise ValueError(ERROR_MSG % input_type)
+
+
+def _vectorize_values(input_types, args):
+    """Vectorize input args, or kwargs values, without extracting shapes.
+
+    Parameters
+    ----------
+    input_types : list
+        Point types corresponding to the args, or kwargs values.
+    args : tuple or dict_values
+        Args, or kwargs values, of a function.
+
+    Returns
+    -------
+    vect_args : list
+        Args, or kwargs values, in their fully-vectorized form.
+    """
+    return [
+        _vectorize_arg(arg, input_type) for arg, input_type in zip(args, input_types)
+    ]
+
+
+def shape_and_vectorize(input_types, args):
+    """Extract initial shapes and vectorize input args in a single pass.
+
+    Parameters
+    ----------
+    input_types : list
+        Point types corresponding to the args, or kwargs values.
+    args : tuple or dict_values
+        Args, or kwargs values, of a function.
+
+    Returns
+    -------
+    in_shapes : list
+        Shapes of array-like input args, or kwargs values.
+    vect_args : list
+        Args, or kwargs values, in their fully-vectorized form.
+    """
+    in_shapes = []
+    vect_args = []
+    for arg, input_type in zip(args, input_types):
+        in_shapes.append(_arg_shape(arg, input_type))
+        vect_args.append(_vectorize_arg(arg, input_type))
+    return in_shapes, vect_args
 
 
 def vectorize_args(input_types, args):
@@ -267,19 +369,7 @@ def vectorize_args(input_types, args):
     vect_args : tuple
         Args of the function in their fully-vectorized form.
     """
-    vect_args = []
-    for arg, input_type in zip(args, input_types):
-        if input_type == "scalar":
-            vect_arg = gs.to_ndarray(arg, to_ndim=1)
-            vect_arg = gs.to_ndarray(vect_arg, to_ndim=2, axis=1)
-        elif input_type in POINT_TYPES and arg is not None:
-            vect_arg = gs.to_ndarray(arg, to_ndim=POINT_TYPES_TO_NDIMS[input_type])
-        elif input_type in OTHER_TYPES or arg is None:
-            vect_arg = arg
-        else:
-            raise ValueError(ERROR_MSG % input_type)
-        vect_args.append(vect_arg)
-    return tuple(vect_args)
+    return tuple(_vectorize_values(input_types, args))
 
 
 def vectorize_kwargs(input_types, kwargs):
@@ -306,20 +396,8 @@ def vectorize_kwargs(input_types, kwargs):
     vect_kwargs : dict
         Kwargs of the function in their fully-vectorized form.
     """
-    vect_kwargs = {}
-    for key_arg, input_type in zip(kwargs.keys(), input_types):
-        arg = kwargs[key_arg]
-        if input_type == "scalar":
-            vect_arg = gs.to_ndarray(arg, to_ndim=1)
-            vect_arg = gs.to_ndarray(vect_arg, to_ndim=2, axis=1)
-        elif input_type in POINT_TYPES and arg is not None:
-            vect_arg = gs.to_ndarray(arg, to_ndim=POINT_TYPES_TO_NDIMS[input_type])
-        elif input_type in OTHER_TYPES or arg is None:
-            vect_arg = arg
-        else:
-            raise ValueError(ERROR_MSG % input_type)
-        vect_kwargs[key_arg] = vect_arg
-    return vect_kwargs
+    vect_values = _vectorize_values(input_types, kwargs.values())
+    return dict(zip(kwargs.keys(), vect_values))
 
 
 def adapt_result(result, initial_shapes, args_kwargs_types, is_scal):
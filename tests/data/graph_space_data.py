@@ -98,6 +98,45 @@ class GraphSpaceTestData(_PointSetTestData):
             n_reps=3,
         )
 
+    def permute_large_batch_test_data(self):
+        space = self._PointSet(4)
+        smoke_data = []
+        for n_graphs, n_perms in [(40, 40), (1, 40), (40, 1)]:
+            graphs = Matrices(4, 4).random_point(n_graphs)
+            perms = gs.array(
+                [random.sample(range(4), 4) for _ in range(n_perms)], dtype=gs.int64
+            )
+            smoke_data.append(dict(space=space, graph=graphs, permutation=perms))
+
+        return self.generate_tests(smoke_data)
+
+    def permute_mismatched_batch_test_data(self):
+        space = self._PointSet(3)
+        smoke_data = [
+            dict(
+                space=space,
+                graph=Matrices(3, 3).random_point(n_graphs),
+                permutation=gs.array([[2, 0, 1]] * n_perms, dtype=gs.int64),
+            )
+            for n_graphs, n_perms in [(40, 33), (10, 7)]
+        ]
+
+        return self.generate_tests(smoke_data)
+
+    def permute_out_of_range_test_data(self):
+        space = self._PointSet(3)
+        smoke_data = [
+            dict(
+                space=space,
+                graph=Matrices(3, 3).random_point(n_graphs),
+                permutation=gs.array([permutation] * n_graphs, dtype=gs.int64),
+            )
+            for n_graphs in [40, 5]
+            for permutation in [[0, 1, 5], [-1, 0, 1]]
+        ]
+
+        return self.generate_tests(smoke_data)
+
     def pad_with_zeros_test_data(self):
 
         space = self._PointSet(4)
@@ -144,6 +183,15 @@ class GraphTestData(_PointTestData):
 
         return self.generate_tests(smoke_data)
 
+    def hash_test_data(self):
+        adj = gs.array([[1.0, 2.0], [3.0, 4.0]])
+
+        smoke_data = [
+            dict(point_a=self._Point(adj), point_b=self._Point(gs.copy(adj))),
+        ]
+
+        return self.generate_tests(smoke_data)
+
 
 class GraphSpaceMetricTestData(_PointMetricTestData):
     _PointSetMetric = GraphSpaceMetric
@@ -231,6 +279,14 @@ class GraphSpaceMetricTestData(_PointMetricTestData):
 
         return self.generate_tests(smoke_data)
 
+    def set_point_to_geodesic_aligner_raises_test_data(self):
+        space = GraphSpace(2)
+        smoke_data = [
+            dict(metric=GraphSpaceMetric(space), aligner="foo"),
+        ]
+
+        return self.generate_tests(smoke_data)
+
 
 class DecoratorsTestData(TestData):
     _Point = GraphPoint
@@ -349,6 +405,46 @@ class AlignerTestData(TestData):
             smoke_data, ["base_point", "permute_point"]
         )
 
+    def id_aligner_perm_test_data(self):
+        smoke_data = []
+        for space in self.spaces:
+            metric = GraphSpaceMetric(space)
+            base_point, permute_point = space.random_point(4), space.random_point(4)
+            smoke_data.append(
+                dict(
+                    metric=metric,
+                    base_point=base_point,
+                    permute_point=permute_point,
+                    expected=gs.stack([gs.arange(space.n_nodes)] * 4),
+                )
+            )
+
+        return self.generate_tests(smoke_data)
+
+    def align_n_jobs_test_data(self):
+        smoke_data = []
+        for space in self.spaces:
+            metric = GraphSpaceMetric(space)
+            base_points, permute_points = space.random_point(4), space.random_point(4)
+            for base_point in [base_points, base_points[0]]:
+                sequential_aligner = FAQAligner()
+                expected = sequential_aligner.align(
+                    metric, base_point, permute_points
+                )
+                for n_jobs in [2, None]:
+                    smoke_data.append(
+                        dict(
+                            metric=metric,
+                            aligner=FAQAligner(n_jobs=n_jobs),
+                            base_point=base_point,
+                            permute_point=permute_points,
+                            expected=expected,
+                            expected_perm=sequential_aligner.perm_,
+                        )
+                    )
+
+        return self.generate_tests(smoke_data)
+
 
 class PointToGeodesicAlignerTestData(TestData):
     tolerances = {
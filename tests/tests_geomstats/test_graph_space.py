@@ -1,6 +1,7 @@
 """Unit tests for the graphspace quotient space."""
 
 import networkx as nx
+import pytest
 
 import geomstats.backend as gs
 from tests.conftest import Parametrizer, TestCase, np_backend
@@ -52,6 +53,24 @@ class TestGraphSpace(PointSetTestCase, metaclass=Parametrizer):
         permuted_graph = space.permute(graph, permutation)
         self.assertAllClose(permuted_graph, expected)
 
+    def test_permute_large_batch(self, space, graph, permutation):
+        permuted_graph = space.permute(graph, permutation)
+
+        graphs = gs.broadcast_to(graph, permuted_graph.shape)
+        perms = gs.broadcast_to(permutation, permuted_graph.shape[:2])
+        expected = gs.stack(
+            [graph_[perm][:, perm] for graph_, perm in zip(graphs, perms)]
+        )
+        self.assertAllClose(permuted_graph, expected)
+
+    def test_permute_mismatched_batch(self, space, graph, permutation):
+        with pytest.raises(ValueError):
+            space.permute(graph, permutation)
+
+    def test_permute_out_of_range(self, space, graph, permutation):
+        with pytest.raises(IndexError):
+            space.permute(graph, permutation)
+
     def test_set_to_networkx(self, space, points):
         nx_objects = space.set_to_networkx(points)
 
@@ -89,6 +108,12 @@ class TestGraphPoint(PointTestCase, metaclass=Parametrizer):
     def test_to_networkx(self, point):
         self.assertTrue(type(point.to_networkx()), nx.classes.graph.Graph)
 
+    def test_hash(self, point_a, point_b):
+        self.assertEqual(hash(point_a), hash(point_b))
+
+        point_b.adj = gs.pad(point_b.adj, [[0, 1], [0, 1]])
+        self.assertTrue(hash(point_a) != hash(point_b))
+
 
 class TestGraphSpaceMetric(PointSetMetricTestCase, metaclass=Parametrizer):
     skip_all = IS_NOT_NP
@@ -147,6 +172,10 @@ class TestGraphSpaceMetric(PointSetMetricTestCase, metaclass=Parametrizer):
         aligned_point = metric.align_point_to_geodesic(geodesic, point)
         self.assertAllClose(aligned_point, expected)
 
+    def test_set_point_to_geodesic_aligner_raises(self, metric, aligner):
+        with pytest.raises(ValueError):
+            metric.set_point_to_geodesic_aligner(aligner)
+
 
 class TestDecorators(TestCase, metaclass=Parametrizer):
     skip_all = IS_NOT_NP
@@ -222,6 +251,21 @@ class TestAligner(TestCase, metaclass=Parametrizer):
         else:
             self.assertEqual(out_ndim, 2)
 
+    def test_id_aligner_perm(self, metric, base_point, permute_point, expected):
+        aligner = metric.set_aligner("ID")
+        aligner.align(metric, base_point, permute_point)
+
+        self.assertEqual(aligner.perm_.shape, expected.shape)
+        self.assertAllClose(aligner.perm_, expected)
+
+    def test_align_n_jobs(
+        self, metric, aligner, base_point, permute_point, expected, expected_perm
+    ):
+        res = aligner.align(metric, base_point, permute_point)
+
+        self.assertAllClose(res, expected)
+        self.assertAllClose(aligner.perm_, expected_perm)
+
 
 class TestPointToGeodesicAligner(TestCase, metaclass=Parametrizer):
     skip_all = IS_NOT_NP
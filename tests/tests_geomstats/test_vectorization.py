@@ -207,6 +207,17 @@ class TestVectorization(tests.conftest.TestCase):
 
         self.assertAllClose(result, expected)
 
+    def test_decorator_scalar_without_squeeze_dim1_with_unordered_kwargs(self):
+        vec_a = gs.array([1, 2, 3])
+        vec_b = gs.array([0, 1, 0])
+        scalar = 4
+        result = self.func_scalar_input_output(
+            in_scalar=scalar, tangent_vec_b=vec_b, tangent_vec_a=vec_a
+        )
+        expected = 8
+
+        self.assertAllClose(result, expected)
+
     def test_decorator_scalar_output_vectorization(self):
         vec_a = gs.array([[1, 2, 3], [1, 2, 3]])
         vec_b = gs.array([0, 1, 0])
@@ -328,6 +339,23 @@ class TestVectorization(tests.conftest.TestCase):
 
         self.assertAllClose(result, expected)
 
+    def test_shape_and_vectorize(self):
+        point_types = ["scalar", "vector", "else"]
+        args = (1.3, gs.array([1.0, 2.0]), "name")
+        shapes, vect_args = geomstats.vectorization.shape_and_vectorize(
+            point_types, args
+        )
+        self.assertEqual(shapes, [(), (2,), None])
+        self.assertAllClose(vect_args[0], gs.array([[1.3]]))
+        self.assertAllClose(vect_args[1], gs.array([[1.0, 2.0]]))
+        self.assertEqual(vect_args[2], "name")
+
+    def test_get_initial_shapes(self):
+        point_types = ["scalar", "matrix", "vector", "else"]
+        args = (1.3, gs.ones(3), None, "name")
+        shapes = geomstats.vectorization.get_initial_shapes(point_types, args)
+        self.assertEqual(shapes, [(), (3,), None, None])
+
     def test_is_point_type_vector(self):
         point = gs.array([1.0, 2.0, 3.0])
         result = self.is_point_type_vector(self.obj, point, point_type="vector")